@@ -0,0 +1,96 @@
+"""
+Optional Numba kernels for quota share cashflow analysis.
+Numba is not a hard dependency; callers check NUMBA_AVAILABLE and fall back
+to the NumPy implementation when it is not installed.
+"""
+
+try:
+    from numba import njit, prange, vectorize
+except ImportError:
+    NUMBA_AVAILABLE = False
+else:
+    NUMBA_AVAILABLE = True
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=False, cache=True, fastmath=True)
+    def _cashflow_kernel(premiums, claims, cr, cc, pcr, pth, aal, has_aal,
+                         out_ceded, out_retained, out_comm, out_rein_claims,
+                         out_cedant_claims, out_pc, out_net, out_lr):
+        """
+        Fused single-pass cashflow computation.
+        
+        Mirrors QuotaShareTreaty.generate_cashflow_analysis: running totals of
+        ceded premium and (limit-capped) ceded claims drive the profit
+        commission of each period. Results are written into the out_* arrays.
+        """
+        # Seed every running value in the input precision so float32 runs
+        # are not silently promoted to float64 inside the loop
+        zero = premiums.dtype.type(0.0)
+        hundred = premiums.dtype.type(100.0)
+        cum_prem = zero
+        cum_rein = zero
+        cum_claims = zero
+        
+        for i in range(premiums.shape[0]):
+            ceded = premiums[i] * cr
+            comm = ceded * cc
+            rein_claims = claims[i] * cr
+            
+            # Cap the running total of reinsurer claims at the aggregate limit
+            cum_rein += rein_claims
+            if has_aal:
+                capped = min(cum_rein, aal)
+                rein_claims = capped - cum_claims
+                cum_claims = capped
+            else:
+                cum_claims = cum_rein
+            cum_prem += ceded
+            
+            pc = zero
+            if cum_prem > zero and cum_claims / cum_prem < pth:
+                pc = max((cum_prem - cum_claims) * pcr, zero)
+            
+            out_ceded[i] = ceded
+            out_retained[i] = premiums[i] - ceded
+            out_comm[i] = comm
+            out_rein_claims[i] = rein_claims
+            out_cedant_claims[i] = claims[i] - rein_claims
+            out_pc[i] = pc
+            out_net[i] = (ceded - comm) - rein_claims - pc
+            out_lr[i] = rein_claims / ceded * hundred if ceded > zero else zero
+    
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _portfolio_kernel(cr, cc, pcr, th, aal, has_aal, premiums, claims, out):
+        """
+        Cashflow analysis for many treaties in parallel.
+        
+        Each treaty t runs the serial _cashflow_kernel over the shared
+        premiums and claims and writes its (P, K) result into out[t], so the
+        prange iterations never touch the same memory.
+        """
+        for t in prange(out.shape[0]):
+            _cashflow_kernel(premiums, claims, cr[t], cc[t], pcr[t], th[t],
+                             aal[t], has_aal[t],
+                             out[t, :, 0], out[t, :, 1], out[t, :, 2], out[t, :, 3],
+                             out[t, :, 4], out[t, :, 5], out[t, :, 6], out[t, :, 7])
+
+
+    # NumPy picks the first loop the inputs can be cast to, so the narrower
+    # float32 signature has to come first
+    @vectorize(['float32(float32, float32, float32, float32)',
+                'float64(float64, float64, float64, float64)'],
+               nopython=True, cache=True)
+    def _profit_commission_ufunc(cum_prem, cum_claims, pcr, threshold):
+        """
+        Profit commission ufunc over cumulative ceded premium and claims.
+        
+        pcr (as a fraction) and threshold broadcast like any ufunc argument.
+        """
+        if cum_prem <= 0.0:
+            return 0.0
+        if cum_claims / cum_prem < threshold:
+            pc = (cum_prem - cum_claims) * pcr
+            return pc if pc > 0.0 else 0.0
+        return 0.0
@@ -0,0 +1,116 @@
+"""
+Optional CuPy implementation of the portfolio cashflow analysis.
+CuPy is not a hard dependency. The GPU path is only taken when the inputs
+already live on the device, so host/device copies never dominate the run.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
+CUPY_AVAILABLE = cp is not None
+
+
+if CUPY_AVAILABLE:
+    _profit_commission_kernel = cp.ElementwiseKernel(
+        'float64 cum_prem, float64 cum_claims, float64 pcr, float64 threshold',
+        'float64 pc',
+        '''
+        pc = 0.0;
+        if (cum_prem > 0.0 && cum_claims / cum_prem < threshold) {
+            pc = (cum_prem - cum_claims) * pcr;
+            if (pc < 0.0) {
+                pc = 0.0;
+            }
+        }
+        ''',
+        'profit_commission'
+    )
+
+
+def is_device_array(values) -> bool:
+    """Return True if values is a CuPy array already resident on the GPU."""
+    return CUPY_AVAILABLE and isinstance(values, cp.ndarray)
+
+
+def _validate_device_arrays(premiums, claims) -> None:
+    """Device-side counterpart of the CPU input validation."""
+    for name, values in (('Premiums', premiums), ('Claims', claims)):
+        valid = cp.isfinite(values) & (values >= 0)
+        if not bool(valid.all()):
+            index = np.unravel_index(int(cp.argmax(~valid)), values.shape)
+            index = int(index[0]) if values.ndim == 1 else tuple(int(i) for i in index)
+            raise ValueError(f"{name} must be finite and non-negative "
+                             f"(got {values[index].item()} at index {index})")
+
+
+def analyze_portfolio_gpu(treaties: Sequence, premiums, claims):
+    """
+    GPU version of QuotaShareTreaty.apply_portfolio.
+    
+    Args:
+        treaties: Treaties to evaluate
+        premiums: CuPy array of gross premiums, shape (S, P) of scenarios
+            by periods (any (..., P) shape is accepted)
+        claims: CuPy array of gross claims, same shape as premiums
+        
+    Returns:
+        CuPy array of shape (T, ..., P, K) where the last axis follows
+        CASHFLOW_FIELDS
+    """
+    if not CUPY_AVAILABLE:
+        raise ImportError("cupy is required for GPU portfolio analysis")
+    
+    premiums = cp.asarray(premiums, dtype=cp.float64)
+    claims = cp.asarray(claims, dtype=cp.float64)
+    if premiums.ndim == 0 or premiums.shape != claims.shape:
+        raise ValueError("Premiums and claims must be arrays of the same shape")
+    _validate_device_arrays(premiums, claims)
+    
+    # Treaty parameters as (T, 1, ..., 1) so they broadcast over the scenarios
+    # and periods; only these few values are copied to the device
+    shape = (len(treaties),) + (1,) * premiums.ndim
+    
+    def stack(values):
+        return cp.asarray(np.array(values, dtype=np.float64).reshape(shape))
+    
+    cr = stack([t._cr for t in treaties])
+    cc = stack([t._cc for t in treaties])
+    pcr = stack([t._pcr for t in treaties])
+    threshold = stack([t.profit_commission_threshold for t in treaties])
+    aal = stack([t.annual_aggregate_limit or np.inf for t in treaties])
+    
+    ceded_premium = premiums * cr
+    ceding_commission = ceded_premium * cc
+    
+    # Cap the running total of reinsurer claims per treaty; unlimited
+    # treaties keep their uncapped per-period claims
+    reinsurer_claims = claims * cr
+    cumulative_ceded_claims = cp.minimum(cp.cumsum(reinsurer_claims, axis=-1), aal)
+    capped_claims = cp.diff(cumulative_ceded_claims, axis=-1,
+                            prepend=cp.zeros_like(cumulative_ceded_claims[..., :1]))
+    reinsurer_claims = cp.where(cp.isfinite(aal), capped_claims, reinsurer_claims)
+    
+    cumulative_ceded_premium = cp.cumsum(ceded_premium, axis=-1)
+    profit_comm = _profit_commission_kernel(cumulative_ceded_premium,
+                                            cumulative_ceded_claims, pcr, threshold)
+    
+    has_premium = ceded_premium > 0
+    safe_premium = cp.where(has_premium, ceded_premium, 1.0)
+    loss_ratio = cp.where(has_premium, reinsurer_claims / safe_premium * 100, 0.0)
+    
+    return cp.stack([
+        ceded_premium,
+        premiums - ceded_premium,
+        ceding_commission,
+        reinsurer_claims,
+        claims - reinsurer_claims,
+        profit_comm,
+        ceded_premium - ceding_commission - reinsurer_claims - profit_comm,
+        loss_ratio,
+    ], axis=-1)
@@ -3,12 +3,109 @@ Quota Share Treaty Calculator Module
 Used for calculating premiums under proportional quota share treaties
 """
 
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+import sys
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass, field
+import numpy as np
 import pandas as pd
 
+from . import _fast, _gpu
 
-@dataclass
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Below this many periods the NumPy path is as fast as the Numba kernel
+_NUMBA_MIN_PERIODS = 1_000
+
+# Result fields computed by the cashflow analysis, in portfolio array order
+CASHFLOW_FIELDS = (
+    'ceded_premium',
+    'retained_premium',
+    'ceding_commission',
+    'reinsurer_claims',
+    'cedant_claims',
+    'profit_commission',
+    'reinsurer_net_position',
+    'loss_ratio',
+)
+
+# DataFrame column name for each generate_cashflow_analysis_arrays result
+_CASHFLOW_COLUMNS = {
+    'gross_premium': 'Gross_Premium',
+    'ceded_premium': 'Ceded_Premium',
+    'retained_premium': 'Retained_Premium',
+    'ceding_commission': 'Ceding_Commission',
+    'gross_claims': 'Gross_Claims',
+    'reinsurer_claims': 'Reinsurer_Claims',
+    'cedant_claims': 'Cedant_Claims',
+    'profit_commission': 'Profit_Commission',
+    'reinsurer_net_position': 'Reinsurer_Net_Position',
+    'loss_ratio': 'Loss_Ratio',
+}
+
+# slots=True needs Python 3.10+; older interpreters get a plain frozen dataclass
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _as_float_array(values, dtype=np.float64, copy: bool = False) -> np.ndarray:
+    """
+    Coerce a scalar, list or array of amounts to a floating point ndarray.
+    
+    Pass copy=True when the array is handed back to the caller, so results
+    never share memory with the caller's input.
+    """
+    if copy:
+        return np.array(values, dtype=dtype, copy=True)
+    return np.asarray(values, dtype=dtype)
+
+
+def _validate_arrays(premiums: np.ndarray, claims: np.ndarray) -> None:
+    """Reject negative or non-finite amounts, reporting the first bad index."""
+    for name, values in (('Premiums', premiums), ('Claims', claims)):
+        valid = np.isfinite(values) & (values >= 0)
+        if not valid.all():
+            index = np.unravel_index(np.argmax(~valid), values.shape)
+            index = int(index[0]) if values.ndim == 1 else tuple(int(i) for i in index)
+            raise ValueError(f"{name} must be finite and non-negative "
+                             f"(got {values[index]} at index {index})")
+
+
+def _loss_ratio(reinsurer_claims: np.ndarray, ceded_premium: np.ndarray) -> np.ndarray:
+    """Loss ratio in percent, zero for periods without ceded premium."""
+    loss_ratio = np.zeros_like(ceded_premium)
+    np.divide(reinsurer_claims, ceded_premium, out=loss_ratio, where=ceded_premium > 0)
+    loss_ratio *= 100.0
+    return loss_ratio
+
+
+def _profit_commission(cum_prem: np.ndarray,
+                       cum_claims: np.ndarray,
+                       pcr,
+                       threshold) -> np.ndarray:
+    """
+    Branchless profit commission on cumulative ceded premium and claims.
+    
+    pcr (as a fraction) and threshold may be scalars or arrays that
+    broadcast against the cumulative totals.
+    """
+    if _fast.NUMBA_AVAILABLE:
+        # One fused pass instead of materialising the intermediate masks.
+        # LLVM may evaluate the division in lanes without premium, which only
+        # sets the FP status flags; those lanes return 0 regardless
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return _fast._profit_commission_ufunc(cum_prem, cum_claims, pcr, threshold)
+    
+    has_premium = cum_prem > 0
+    safe_prem = np.where(has_premium, cum_prem, 1.0)
+    loss_ratio = cum_claims / safe_prem
+    
+    profit_commission = (cum_prem - cum_claims) * pcr
+    
+    return np.where(has_premium & (loss_ratio < threshold),
+                    np.maximum(profit_commission, 0.0), 0.0)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class QuotaShareTreaty:
     """
     Represents a Quota Share reinsurance treaty.
@@ -26,13 +123,44 @@ class QuotaShareTreaty:
     profit_commission_threshold: float = 0.65
     annual_aggregate_limit: Optional[float] = None
     
+    # Rate fractions derived in __post_init__
+    _cr: float = field(init=False, repr=False, compare=False)
+    _cc: float = field(init=False, repr=False, compare=False)
+    _pcr: float = field(init=False, repr=False, compare=False)
+    _cr_f64: np.float64 = field(init=False, repr=False, compare=False)
+    _cc_f64: np.float64 = field(init=False, repr=False, compare=False)
+    _pcr_f64: np.float64 = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate treaty parameters"""
         if not 0 <= self.cession_rate <= 100:
             raise ValueError("Cession rate must be between 0 and 100")
         if not 0 <= self.commission_rate <= 100:
             raise ValueError("Commission rate must be between 0 and 100")
+        
+        # Rates are fixed for the life of the treaty, so convert the
+        # percentages to fractions once
+        object.__setattr__(self, '_cr', self.cession_rate * 0.01)
+        object.__setattr__(self, '_cc', self.commission_rate * 0.01)
+        object.__setattr__(self, '_pcr', self.profit_commission_rate * 0.01)
+        
+        # NumPy scalar copies for the vectorized paths
+        object.__setattr__(self, '_cr_f64', np.float64(self._cr))
+        object.__setattr__(self, '_cc_f64', np.float64(self._cc))
+        object.__setattr__(self, '_pcr_f64', np.float64(self._pcr))
             
+    def _rate_fractions(self, dtype) -> Tuple[np.floating, np.floating, np.floating]:
+        """
+        Cession, commission and profit commission fractions as NumPy scalars.
+        
+        The cached float64 scalars are returned as-is; other precisions are
+        converted from them.
+        """
+        rates = (self._cr_f64, self._cc_f64, self._pcr_f64)
+        if dtype == np.float64:
+            return rates
+        return tuple(np.dtype(dtype).type(rate) for rate in rates)
+    
     def calculate_premium(self, gross_premium: float) -> Dict[str, float]:
         """
         Calculate reinsurance premium and related metrics.
@@ -43,11 +171,33 @@ class QuotaShareTreaty:
         Returns:
             Dictionary containing calculated values
         """
+        (ceded_premium, retained_premium,
+         ceding_commission, net_premium_to_reinsurer) = (
+            self._calculate_premium_tuple(gross_premium))
+        
+        return {
+            'gross_premium': gross_premium,
+            'cession_rate': self.cession_rate,
+            'ceded_premium': ceded_premium,
+            'retained_premium': retained_premium,
+            'ceding_commission': ceding_commission,
+            'net_premium_to_reinsurer': net_premium_to_reinsurer,
+            'commission_rate': self.commission_rate
+        }
+    
+    def _calculate_premium_tuple(self,
+                                 gross_premium: float) -> Tuple[float, float, float, float]:
+        """
+        Allocation-light core of calculate_premium.
+        
+        Returns:
+            Tuple of (ceded, retained, ceding commission, net to reinsurer)
+        """
         # Calculate ceded premium
-        ceded_premium = gross_premium * (self.cession_rate / 100)
+        ceded_premium = gross_premium * self._cr
         
         # Calculate ceding commission
-        ceding_commission = ceded_premium * (self.commission_rate / 100)
+        ceding_commission = ceded_premium * self._cc
         
         # Net premium to reinsurer
         net_premium_to_reinsurer = ceded_premium - ceding_commission
@@ -55,14 +205,31 @@ class QuotaShareTreaty:
         # Retained premium by cedant
         retained_premium = gross_premium - ceded_premium
         
+        return ceded_premium, retained_premium, ceding_commission, net_premium_to_reinsurer
+    
+    def calculate_premium_vec(self, premiums, dtype=np.float64) -> Dict[str, np.ndarray]:
+        """
+        Vectorized version of calculate_premium over many periods.
+        
+        Args:
+            premiums: Sequence or array of gross written premiums
+            dtype: Floating point type used for the calculation
+            
+        Returns:
+            Dictionary of arrays, one entry per premium component
+        """
+        premiums = _as_float_array(premiums, dtype, copy=True)
+        cr, cc, _ = self._rate_fractions(premiums.dtype)
+        
+        ceded_premium = premiums * cr
+        ceding_commission = ceded_premium * cc
+        
         return {
-            'gross_premium': gross_premium,
-            'cession_rate': self.cession_rate,
+            'gross_premium': premiums,
             'ceded_premium': ceded_premium,
-            'retained_premium': retained_premium,
+            'retained_premium': premiums - ceded_premium,
             'ceding_commission': ceding_commission,
-            'net_premium_to_reinsurer': net_premium_to_reinsurer,
-            'commission_rate': self.commission_rate
+            'net_premium_to_reinsurer': ceded_premium - ceding_commission
         }
     
     def calculate_claims(self, gross_claims: float) -> Dict[str, float]:
@@ -75,8 +242,24 @@ class QuotaShareTreaty:
         Returns:
             Dictionary with claims distribution
         """
+        reinsurer_claims, cedant_claims = self._calculate_claims_tuple(gross_claims)
+        
+        return {
+            'gross_claims': gross_claims,
+            'reinsurer_claims': reinsurer_claims,
+            'cedant_claims': cedant_claims,
+            'claims_ratio': (reinsurer_claims / gross_claims * 100) if gross_claims > 0 else 0
+        }
+    
+    def _calculate_claims_tuple(self, gross_claims: float) -> Tuple[float, float]:
+        """
+        Allocation-light core of calculate_claims.
+        
+        Returns:
+            Tuple of (reinsurer claims, cedant claims)
+        """
         # Claims follow the same proportion as premiums
-        reinsurer_claims = gross_claims * (self.cession_rate / 100)
+        reinsurer_claims = gross_claims * self._cr
         
         # Apply annual aggregate limit if specified
         if self.annual_aggregate_limit:
@@ -84,12 +267,7 @@ class QuotaShareTreaty:
             
         cedant_claims = gross_claims - reinsurer_claims
         
-        return {
-            'gross_claims': gross_claims,
-            'reinsurer_claims': reinsurer_claims,
-            'cedant_claims': cedant_claims,
-            'claims_ratio': (reinsurer_claims / gross_claims * 100) if gross_claims > 0 else 0
-        }
+        return reinsurer_claims, cedant_claims
     
     def calculate_profit_commission(self, 
                                    ceded_premium: float, 
@@ -111,15 +289,149 @@ class QuotaShareTreaty:
         
         if loss_ratio < self.profit_commission_threshold:
             profit = ceded_premium - ceded_claims
-            profit_commission = profit * (self.profit_commission_rate / 100)
+            profit_commission = profit * self._pcr
             return max(0, profit_commission)
         
         return 0
     
+    def _profit_commission_vec(self,
+                               cum_prem: np.ndarray,
+                               cum_claims: np.ndarray) -> np.ndarray:
+        """
+        Vectorized calculate_profit_commission over cumulative totals.
+        
+        Args:
+            cum_prem: Cumulative ceded premium by period
+            cum_claims: Cumulative ceded claims by period
+            
+        Returns:
+            Array of profit commission amounts
+        """
+        dtype = cum_prem.dtype
+        return _profit_commission(cum_prem, cum_claims,
+                                  self._rate_fractions(dtype)[2],
+                                  dtype.type(self.profit_commission_threshold))
+    
+    def _cashflow_columns(self,
+                          premiums: np.ndarray,
+                          claims: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Compute the cashflow analysis columns with NumPy array operations.
+        
+        Args:
+            premiums: Gross premiums by period
+            claims: Gross claims by period
+            
+        Returns:
+            Dictionary of per-period arrays
+        """
+        dtype = premiums.dtype
+        premium_calc = self.calculate_premium_vec(premiums, dtype)
+        ceded_premium = premium_calc['ceded_premium']
+        
+        # Claims follow the same proportion as premiums
+        reinsurer_claims = claims * self._rate_fractions(dtype)[0]
+        cumulative_ceded_claims = np.cumsum(reinsurer_claims)
+        
+        # The annual aggregate limit caps the running total of reinsurer
+        # claims, not each period on its own
+        if self.annual_aggregate_limit:
+            cumulative_ceded_claims = np.minimum(cumulative_ceded_claims,
+                                                 dtype.type(self.annual_aggregate_limit))
+            reinsurer_claims = np.diff(cumulative_ceded_claims, prepend=dtype.type(0))
+        
+        # Profit commission is assessed on the running treaty result
+        cumulative_ceded_premium = np.cumsum(ceded_premium)
+        profit_comm = self._profit_commission_vec(cumulative_ceded_premium,
+                                                  cumulative_ceded_claims)
+        
+        # Reinsurer's net position
+        reinsurer_net = (premium_calc['net_premium_to_reinsurer'] - 
+                         reinsurer_claims - 
+                         profit_comm)
+        
+        loss_ratio = _loss_ratio(reinsurer_claims, ceded_premium)
+        
+        return {
+            'ceded_premium': ceded_premium,
+            'retained_premium': premium_calc['retained_premium'],
+            'ceding_commission': premium_calc['ceding_commission'],
+            'reinsurer_claims': reinsurer_claims,
+            'cedant_claims': claims - reinsurer_claims,
+            'profit_commission': profit_comm,
+            'reinsurer_net_position': reinsurer_net,
+            'loss_ratio': loss_ratio
+        }
+    
+    def _cashflow_columns_numba(self,
+                                premiums: np.ndarray,
+                                claims: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Compute the cashflow analysis columns with the fused Numba kernel.
+        
+        Args:
+            premiums: Gross premiums by period
+            claims: Gross claims by period
+            
+        Returns:
+            Dictionary of per-period arrays
+        """
+        dtype = premiums.dtype
+        result = {key: np.empty_like(premiums) for key in CASHFLOW_FIELDS}
+        
+        cr, cc, pcr = self._rate_fractions(dtype)
+        
+        _fast._cashflow_kernel(
+            premiums, claims, cr, cc, pcr,
+            dtype.type(self.profit_commission_threshold),
+            dtype.type(self.annual_aggregate_limit or 0),
+            bool(self.annual_aggregate_limit),
+            *result.values()
+        )
+        return result
+    
+    def generate_cashflow_analysis_arrays(self,
+                                         premiums,
+                                         claims,
+                                         dtype=np.float64) -> Dict[str, np.ndarray]:
+        """
+        Generate the period-by-period cashflow analysis as NumPy arrays.
+        
+        Intended as the inner loop of stochastic treaty modelling: the
+        requested dtype (e.g. np.float32) is kept end-to-end so simulation
+        code can stay in single precision.
+        
+        Args:
+            premiums: Sequence or array of gross premiums by period
+            claims: Sequence or array of gross claims by period
+            dtype: np.float32 or np.float64
+            
+        Returns:
+            Dictionary of per-period arrays of the requested dtype
+        """
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError("dtype must be np.float32 or np.float64")
+        
+        gross_premium = _as_float_array(premiums, dtype, copy=True)
+        gross_claims = _as_float_array(claims, dtype, copy=True)
+        if gross_premium.ndim != 1 or gross_premium.shape != gross_claims.shape:
+            raise ValueError("Premiums and claims must be 1-D sequences of the same length")
+        _validate_arrays(gross_premium, gross_claims)
+        
+        if _fast.NUMBA_AVAILABLE and gross_premium.shape[0] >= _NUMBA_MIN_PERIODS:
+            result = self._cashflow_columns_numba(gross_premium, gross_claims)
+        else:
+            result = self._cashflow_columns(gross_premium, gross_claims)
+        
+        return {'gross_premium': gross_premium, 'gross_claims': gross_claims, **result}
+    
     def generate_cashflow_analysis(self, 
                                   premiums: List[float], 
                                   claims: List[float],
-                                  periods: List[str]) -> pd.DataFrame:
+                                  periods: List[str],
+                                  output: str = 'pandas'
+                                  ) -> Union[pd.DataFrame, 'pa.Table', Dict[str, np.ndarray]]:
         """
         Generate period-by-period cashflow analysis.
         
@@ -127,50 +439,118 @@ class QuotaShareTreaty:
             premiums: List of gross premiums by period
             claims: List of gross claims by period
             periods: List of period labels (e.g., ['Q1', 'Q2', 'Q3', 'Q4'])
+            output: 'pandas' for a DataFrame, 'arrow' for a pyarrow.Table or
+                'numpy' for a dictionary of column arrays
             
         Returns:
-            DataFrame with detailed cashflow analysis
+            Detailed cashflow analysis in the requested format
         """
-        results = []
-        cumulative_ceded_premium = 0
-        cumulative_ceded_claims = 0
+        if output not in ('pandas', 'arrow', 'numpy'):
+            raise ValueError("Output must be one of 'pandas', 'arrow' or 'numpy'")
         
-        for period, premium, claim in zip(periods, premiums, claims):
-            # Calculate premium components
-            premium_calc = self.calculate_premium(premium)
-            claims_calc = self.calculate_claims(claim)
-            
-            cumulative_ceded_premium += premium_calc['ceded_premium']
-            cumulative_ceded_claims += claims_calc['reinsurer_claims']
-            
-            # Calculate profit commission for the period
-            profit_comm = self.calculate_profit_commission(
-                cumulative_ceded_premium, 
-                cumulative_ceded_claims
-            )
-            
-            # Reinsurer's net position
-            reinsurer_net = (premium_calc['net_premium_to_reinsurer'] - 
-                           claims_calc['reinsurer_claims'] - 
-                           profit_comm)
+        # zip() semantics: only periods present in all three inputs are analysed
+        n = min(len(periods), len(premiums), len(claims))
+        result = self.generate_cashflow_analysis_arrays(premiums[:n], claims[:n])
+        
+        # Wrap the column arrays directly rather than copying them into a
+        # row-oriented structure first
+        columns = {'Period': list(periods[:n])}
+        columns.update((name, result[key]) for key, name in _CASHFLOW_COLUMNS.items())
+        
+        if output == 'numpy':
+            columns['Period'] = np.asarray(columns['Period'])
+            return columns
+        
+        if output == 'arrow':
+            try:
+                import pyarrow as pa
+            except ImportError as exc:
+                raise ImportError("pyarrow is required for output='arrow'") from exc
+            return pa.Table.from_pydict({name: pa.array(values)
+                                         for name, values in columns.items()})
+        
+        return pd.DataFrame(columns, copy=False)
+    
+    @staticmethod
+    def apply_portfolio(treaties: Sequence['QuotaShareTreaty'],
+                        premiums,
+                        claims) -> np.ndarray:
+        """
+        Run the cashflow analysis for many treaties at once.
+        
+        Treaty parameters are stacked into arrays and broadcast against the
+        periods, so every (treaty, period) cell is computed in one pass.
+        If either input is a CuPy array the analysis runs on the GPU and
+        returns a CuPy array.
+        
+        Args:
+            treaties: Treaties to evaluate
+            premiums: Gross premiums by period, shape (P,) or (..., P)
+            claims: Gross claims by period, same shape as premiums
             
-            results.append({
-                'Period': period,
-                'Gross_Premium': premium,
-                'Ceded_Premium': premium_calc['ceded_premium'],
-                'Retained_Premium': premium_calc['retained_premium'],
-                'Ceding_Commission': premium_calc['ceding_commission'],
-                'Gross_Claims': claim,
-                'Reinsurer_Claims': claims_calc['reinsurer_claims'],
-                'Cedant_Claims': claims_calc['cedant_claims'],
-                'Profit_Commission': profit_comm,
-                'Reinsurer_Net_Position': reinsurer_net,
-                'Loss_Ratio': (claims_calc['reinsurer_claims'] / 
-                              premium_calc['ceded_premium'] * 100 
-                              if premium_calc['ceded_premium'] > 0 else 0)
-            })
-        
-        return pd.DataFrame(results)
+        Returns:
+            Array of shape (T, ..., P, K) where the last axis follows
+            CASHFLOW_FIELDS
+        """
+        if _gpu.is_device_array(premiums) or _gpu.is_device_array(claims):
+            return _gpu.analyze_portfolio_gpu(treaties, premiums, claims)
+        
+        premiums = _as_float_array(premiums)
+        claims = _as_float_array(claims)
+        if premiums.ndim == 0 or premiums.shape != claims.shape:
+            raise ValueError("Premiums and claims must be arrays of the same shape")
+        _validate_arrays(premiums, claims)
+        
+        # Treaty parameters as (T, 1, ..., 1) so they broadcast over the periods
+        shape = (len(treaties),) + (1,) * premiums.ndim
+        
+        def stack(values):
+            return np.array(values, dtype=np.float64).reshape(shape)
+        
+        cr = stack([t._cr for t in treaties])
+        cc = stack([t._cc for t in treaties])
+        pcr = stack([t._pcr for t in treaties])
+        threshold = stack([t.profit_commission_threshold for t in treaties])
+        aal = stack([t.annual_aggregate_limit or np.inf for t in treaties])
+        
+        # Periods shared by all treaties: run one compiled loop per treaty in
+        # parallel instead of materialising the broadcast intermediates
+        if (_fast.NUMBA_AVAILABLE and premiums.ndim == 1
+                and len(treaties) * premiums.shape[0] >= _NUMBA_MIN_PERIODS):
+            out = np.empty((len(treaties), premiums.shape[0], len(CASHFLOW_FIELDS)))
+            _fast._portfolio_kernel(cr.ravel(), cc.ravel(), pcr.ravel(),
+                                    threshold.ravel(), aal.ravel(),
+                                    np.isfinite(aal.ravel()),
+                                    premiums, claims, out)
+            return out
+        
+        ceded_premium = premiums * cr
+        ceding_commission = ceded_premium * cc
+        
+        # Cap the running total of reinsurer claims per treaty; unlimited
+        # treaties keep their uncapped per-period claims
+        reinsurer_claims = claims * cr
+        cumulative_ceded_claims = np.minimum(np.cumsum(reinsurer_claims, axis=-1), aal)
+        reinsurer_claims = np.where(np.isfinite(aal),
+                                    np.diff(cumulative_ceded_claims, axis=-1, prepend=0.0),
+                                    reinsurer_claims)
+        
+        cumulative_ceded_premium = np.cumsum(ceded_premium, axis=-1)
+        profit_comm = _profit_commission(cumulative_ceded_premium,
+                                         cumulative_ceded_claims, pcr, threshold)
+        
+        loss_ratio = _loss_ratio(reinsurer_claims, ceded_premium)
+        
+        return np.stack([
+            ceded_premium,
+            premiums - ceded_premium,
+            ceding_commission,
+            reinsurer_claims,
+            claims - reinsurer_claims,
+            profit_comm,
+            ceded_premium - ceding_commission - reinsurer_claims - profit_comm,
+            loss_ratio,
+        ], axis=-1)
 
 
 # Example usage function
@@ -208,18 +588,26 @@ def example_quota_share_calculation():
     
     df = treaty.generate_cashflow_analysis(premiums, claims, quarters)
     
-    # Format the DataFrame for display
-    pd.options.display.float_format = '{:,.0f}'.format
-    print(df.to_string(index=False))
+    # Format the DataFrame for display without touching global pandas options
+    with pd.option_context('display.float_format', '{:,.0f}'.format):
+        print(df.to_string(index=False))
+    
+    # Summary statistics, aggregated in a single pass
+    summary = df.agg({
+        'Ceded_Premium': 'sum',
+        'Reinsurer_Claims': 'sum',
+        'Ceding_Commission': 'sum',
+        'Loss_Ratio': 'mean',
+        'Reinsurer_Net_Position': 'sum'
+    })
     
-    # Summary statistics
     print("\n\nAnnual Summary:")
     print("-" * 40)
-    print(f"Total Ceded Premium: ${df['Ceded_Premium'].sum():,.2f}")
-    print(f"Total Reinsurer Claims: ${df['Reinsurer_Claims'].sum():,.2f}")
-    print(f"Total Ceding Commission: ${df['Ceding_Commission'].sum():,.2f}")
-    print(f"Average Loss Ratio: {df['Loss_Ratio'].mean():.2f}%")
-    print(f"Reinsurer Net Result: ${df['Reinsurer_Net_Position'].sum():,.2f}")
+    print(f"Total Ceded Premium: ${summary['Ceded_Premium']:,.2f}")
+    print(f"Total Reinsurer Claims: ${summary['Reinsurer_Claims']:,.2f}")
+    print(f"Total Ceding Commission: ${summary['Ceding_Commission']:,.2f}")
+    print(f"Average Loss Ratio: {summary['Loss_Ratio']:.2f}%")
+    print(f"Reinsurer Net Result: ${summary['Reinsurer_Net_Position']:,.2f}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,173 @@
+"""
+Tests for the treaty calculators
+"""
+
+import numpy as np
+import pytest
+
+from reinsurance_calc.treaties import _fast, quota_share
+from reinsurance_calc.treaties.quota_share import QuotaShareTreaty
+
+requires_numba = pytest.mark.skipif(not _fast.NUMBA_AVAILABLE,
+                                    reason="numba is not installed")
+
+
+QUARTERS = ['Q1 2024', 'Q2 2024', 'Q3 2024', 'Q4 2024']
+PREMIUMS = [2_500_000, 3_000_000, 2_800_000, 3_200_000]
+CLAIMS = [1_500_000, 1_800_000, 2_100_000, 1_900_000]
+
+
+def example_treaty(**overrides) -> QuotaShareTreaty:
+    """The 50% quota share used by example_quota_share_calculation."""
+    params = dict(
+        cession_rate=50,
+        commission_rate=30,
+        profit_commission_rate=20,
+        profit_commission_threshold=0.60,
+        annual_aggregate_limit=10_000_000
+    )
+    params.update(overrides)
+    return QuotaShareTreaty(**params)
+
+
+def test_aggregate_limit_caps_running_reinsurer_claims():
+    treaty = example_treaty(annual_aggregate_limit=2_000_000)
+    df = treaty.generate_cashflow_analysis(PREMIUMS, CLAIMS, QUARTERS)
+    
+    np.testing.assert_allclose(df['Reinsurer_Claims'], [750_000, 900_000, 350_000, 0])
+    np.testing.assert_allclose(df['Cedant_Claims'],
+                               [750_000, 900_000, 1_750_000, 1_900_000])
+    assert df['Reinsurer_Claims'].sum() == pytest.approx(2_000_000)
+
+
+def test_scalar_claims_clamped_per_call():
+    treaty = example_treaty(annual_aggregate_limit=2_000_000)
+    
+    # No running total: every call is clamped on its own
+    for _ in range(2):
+        result = treaty.calculate_claims(5_000_000)
+        assert result['reinsurer_claims'] == 2_000_000
+        assert result['cedant_claims'] == 3_000_000
+
+
+def test_cashflow_analysis_matches_baseline_example():
+    df = example_treaty().generate_cashflow_analysis(PREMIUMS, CLAIMS, QUARTERS)
+    
+    assert list(df['Period']) == QUARTERS
+    np.testing.assert_allclose(df['Ceded_Premium'],
+                               [1_250_000, 1_500_000, 1_400_000, 1_600_000])
+    np.testing.assert_allclose(df['Retained_Premium'],
+                               [1_250_000, 1_500_000, 1_400_000, 1_600_000])
+    np.testing.assert_allclose(df['Ceding_Commission'],
+                               [375_000, 450_000, 420_000, 480_000])
+    np.testing.assert_allclose(df['Reinsurer_Claims'],
+                               [750_000, 900_000, 1_050_000, 950_000])
+    np.testing.assert_allclose(df['Cedant_Claims'],
+                               [750_000, 900_000, 1_050_000, 950_000])
+    np.testing.assert_allclose(df['Profit_Commission'], [0, 0, 0, 0])
+    np.testing.assert_allclose(df['Reinsurer_Net_Position'],
+                               [125_000, 150_000, -70_000, 170_000])
+    np.testing.assert_allclose(df['Loss_Ratio'], [60, 60, 75, 59.375])
+
+
+def random_series(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    premiums = rng.uniform(0, 1_000_000, n)
+    premiums[:3] = 0
+    claims = rng.uniform(0, 800_000, n)
+    return premiums, claims
+
+
+# (treaty, premiums, claims) cases for comparing the cashflow implementations
+CASHFLOW_CASES = {
+    'random_unlimited': (QuotaShareTreaty(40, 27.5, 15, 0.65),) + random_series(500),
+    'random_limited': (QuotaShareTreaty(40, 27.5, 15, 1.5, 50_000_000),)
+                      + random_series(500, seed=1),
+    # Cumulative loss ratio exactly at the profit commission threshold
+    'at_threshold': (QuotaShareTreaty(100, 0, 20, 0.55),
+                     np.full(8, 100.0), np.full(8, 55.0)),
+    # Running reinsurer claims land exactly on the aggregate limit
+    'at_limit': (QuotaShareTreaty(50, 30, 20, 0.6, 2_000_000),
+                 np.full(6, 2_000_000.0), np.full(6, 1_000_000.0)),
+}
+
+
+@requires_numba
+@pytest.mark.parametrize('case', sorted(CASHFLOW_CASES))
+@pytest.mark.parametrize('dtype, rtol', [(np.float64, 1e-9), (np.float32, 1e-5)])
+def test_numba_kernel_matches_numpy_path(case, dtype, rtol):
+    treaty, premiums, claims = CASHFLOW_CASES[case]
+    premiums = premiums.astype(dtype)
+    claims = claims.astype(dtype)
+    
+    expected = treaty._cashflow_columns(premiums, claims)
+    result = treaty._cashflow_columns_numba(premiums, claims)
+    
+    assert expected.keys() == result.keys()
+    for key in expected:
+        assert result[key].dtype == dtype
+        np.testing.assert_allclose(result[key], expected[key], rtol=rtol,
+                                   atol=1e-6 * np.abs(expected[key]).max(initial=1.0),
+                                   err_msg=key)
+
+
+@pytest.mark.parametrize('periods', [4, 1_000])
+def test_profit_commission_at_threshold_independent_of_period_count(periods):
+    treaty = QuotaShareTreaty(100, 0, 20, 0.55)
+    
+    df = treaty.generate_cashflow_analysis([100] * periods, [55] * periods,
+                                           list(range(periods)))
+    
+    assert treaty.calculate_profit_commission(100, 55) == 0
+    assert (df['Profit_Commission'] == 0).all()
+
+
+def mixed_portfolio():
+    """Limited and unlimited treaties, including one at its threshold."""
+    return [
+        QuotaShareTreaty(40, 27.5, 15, 0.65),
+        QuotaShareTreaty(60, 30, 20, 0.9, 20_000_000),
+        QuotaShareTreaty(100, 0, 20, 0.55, 5_000_000),
+        QuotaShareTreaty(0, 0),
+    ]
+
+
+@requires_numba
+@pytest.mark.parametrize('periods, min_periods', [
+    (5, 0),        # T*P below _NUMBA_MIN_PERIODS, kernel forced
+    (2_000, None), # T*P above _NUMBA_MIN_PERIODS, kernel chosen by default
+])
+def test_portfolio_kernel_matches_broadcast_path(monkeypatch, periods, min_periods):
+    treaties = mixed_portfolio()
+    premiums, claims = random_series(periods, seed=2)
+    if min_periods is not None:
+        monkeypatch.setattr(quota_share, '_NUMBA_MIN_PERIODS', min_periods)
+    
+    result = QuotaShareTreaty.apply_portfolio(treaties, premiums, claims)
+    monkeypatch.setattr(_fast, 'NUMBA_AVAILABLE', False)
+    expected = QuotaShareTreaty.apply_portfolio(treaties, premiums, claims)
+    
+    assert result.shape == expected.shape == (len(treaties), periods,
+                                              len(quota_share.CASHFLOW_FIELDS))
+    np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-6)
+
+
+@pytest.mark.parametrize('argument', ['premiums', 'claims'])
+@pytest.mark.parametrize('bad_value', [-1.0, np.nan, np.inf])
+def test_cashflow_analysis_rejects_invalid_amounts(argument, bad_value):
+    values = {'premiums': [100.0] * 4, 'claims': [50.0] * 4}
+    values[argument][2] = bad_value
+    
+    with pytest.raises(ValueError, match=rf"{argument.title()} must be finite and "
+                                         rf"non-negative \(got .* at index 2\)"):
+        example_treaty().generate_cashflow_analysis(values['premiums'],
+                                                    values['claims'], QUARTERS)
+
+
+def test_portfolio_reports_two_dimensional_index():
+    premiums = np.full((2, 3), 100.0)
+    claims = np.full((2, 3), 50.0)
+    claims[1, 2] = np.nan
+    
+    with pytest.raises(ValueError, match=r"Claims .* \(got nan at index \(1, 2\)\)"):
+        QuotaShareTreaty.apply_portfolio(mixed_portfolio(), premiums, claims)